@@ -10,7 +10,128 @@ License: MIT
 """
 
 import string
-from typing import Union, List, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Iterator, Union, List, Tuple
+
+
+# Relative frequency of each letter 'a'-'z' in typical English text
+ENGLISH_FREQ = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015,
+    0.06094, 0.06966, 0.00153, 0.00772, 0.04025, 0.02406, 0.06749,
+    0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056, 0.02758,
+    0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+
+
+def _build_tables() -> Tuple[dict, ...]:
+    """
+    Build the str.translate tables for every shift value 0-25.
+    
+    Returns:
+        Tuple[dict, ...]: Translation table for each shift, indexed by shift
+    """
+    lower = string.ascii_lowercase
+    upper = string.ascii_uppercase
+    return tuple(
+        str.maketrans(
+            lower + upper,
+            lower[shift:] + lower[:shift] + upper[shift:] + upper[:shift]
+        )
+        for shift in range(len(lower))
+    )
+
+
+def _build_byte_tables() -> Tuple[bytes, ...]:
+    """
+    Build the bytes.translate tables for every shift value 0-25.
+    
+    Returns:
+        Tuple[bytes, ...]: 256-byte translation table for each shift,
+        indexed by shift
+    """
+    lower = string.ascii_lowercase.encode("ascii")
+    upper = string.ascii_uppercase.encode("ascii")
+    return tuple(
+        bytes.maketrans(
+            lower + upper,
+            lower[shift:] + lower[:shift] + upper[shift:] + upper[:shift]
+        )
+        for shift in range(len(lower))
+    )
+
+
+# Translation tables for every shift, indexed by shift
+_TRANS_TABLES = _build_tables()
+_BYTE_TABLES = _build_byte_tables()
+
+
+# Inputs at least this long bypass the letter-count cache. The cache keeps
+# its 1024 most recent texts alive, so it retains at most about 4 MB of
+# ASCII text (16 MB if every text needs 4 bytes per character)
+_CACHE_MAX_LENGTH = 4 * 1024
+
+# ASCII inputs shorter than this are shifted as bytes, where the fixed
+# per-call cost is lower; str.translate is faster on longer texts
+_BYTE_PATH_MAX_LENGTH = 4096
+
+
+def _shift_text(text: str, shift: int) -> str:
+    """
+    Shift the letters of text by a normalized shift value.
+    
+    Args:
+        text (str): Text to transform
+        shift (int): Shift value in the range 0-25
+        
+    Returns:
+        str: The shifted text
+    """
+    if len(text) < _BYTE_PATH_MAX_LENGTH and text.isascii():
+        table = _BYTE_TABLES[shift]
+        return text.encode("ascii").translate(table).decode("ascii")
+    
+    # Letters are mapped through a shifted alphabet table; everything
+    # else is left unchanged by str.translate
+    return text.translate(_TRANS_TABLES[shift])
+
+
+def _letter_counts(text: str) -> Tuple[int, ...]:
+    """
+    Count each letter 'a'-'z' in text, ignoring case.
+    
+    Args:
+        text (str): Text to analyze
+        
+    Returns:
+        Tuple[int, ...]: Count of each letter, indexed by alphabet position
+    """
+    # Count every character in C, then fold case by summing each letter's
+    # lowercase and uppercase counts, avoiding a lowercased copy of text
+    counts = Counter(text)
+    return tuple(
+        counts[lower] + counts[upper]
+        for lower, upper in zip(string.ascii_lowercase, string.ascii_uppercase)
+    )
+
+
+# Counts are immutable so repeated queries can share them safely
+_counts_cached = lru_cache(maxsize=1024)(_letter_counts)
+
+
+def _get_letter_counts(text: str) -> Tuple[int, ...]:
+    """
+    Return letter counts for text, shared across analysis methods.
+    
+    Args:
+        text (str): Text to analyze
+        
+    Returns:
+        Tuple[int, ...]: Count of each letter, indexed by alphabet position
+    """
+    if len(text) < _CACHE_MAX_LENGTH:
+        return _counts_cached(text)
+    return _letter_counts(text)
 
 
 class CaesarCipher:
@@ -21,11 +142,17 @@ class CaesarCipher:
     is shifted a certain number of places down or up the alphabet.
     """
     
-    def __init__(self):
-        """Initialize the Caesar cipher with alphabet constants."""
-        self.lowercase_letters = string.ascii_lowercase
-        self.uppercase_letters = string.ascii_uppercase
-        self.alphabet_size = 26
+    # Instances carry no per-object state
+    __slots__ = ()
+    
+    # Alphabet constants
+    lowercase_letters = string.ascii_lowercase
+    uppercase_letters = string.ascii_uppercase
+    alphabet_size = 26
+    
+    # Translation tables for every shift, shared by all instances
+    _TRANS_TABLES = _TRANS_TABLES
+    _BYTE_TABLES = _BYTE_TABLES
     
     def encrypt(self, text: str, shift: int) -> str:
         """
@@ -52,24 +179,7 @@ class CaesarCipher:
         # Normalize shift to be within 0-25 range
         shift = shift % self.alphabet_size
         
-        encrypted_text = []
-        
-        for char in text:
-            if char in self.lowercase_letters:
-                # Handle lowercase letters
-                old_index = self.lowercase_letters.index(char)
-                new_index = (old_index + shift) % self.alphabet_size
-                encrypted_text.append(self.lowercase_letters[new_index])
-            elif char in self.uppercase_letters:
-                # Handle uppercase letters
-                old_index = self.uppercase_letters.index(char)
-                new_index = (old_index + shift) % self.alphabet_size
-                encrypted_text.append(self.uppercase_letters[new_index])
-            else:
-                # Keep non-alphabetic characters unchanged
-                encrypted_text.append(char)
-        
-        return ''.join(encrypted_text)
+        return _shift_text(text, shift)
     
     def decrypt(self, ciphertext: str, shift: int) -> str:
         """
@@ -106,16 +216,91 @@ class CaesarCipher:
             >>> print(results[3])  # Should show the correct decryption
             (3, 'Hello')
         """
+        return list(self.brute_force_iter(ciphertext))
+    
+    def brute_force_iter(self, ciphertext: str) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily try all possible shifts, one decrypted text at a time.
+        
+        Only the current candidate is held in memory, which keeps long
+        ciphertexts from being copied 26 times at once.
+        
+        Args:
+            ciphertext (str): The ciphertext to attack
+            
+        Returns:
+            Iterator[Tuple[int, str]]: (shift, decrypted_text) tuples in
+            shift order
+            
+        Example:
+            >>> cipher = CaesarCipher()
+            >>> next(cipher.brute_force_iter("Khoor"))
+            (0, 'Khoor')
+        """
+        if not isinstance(ciphertext, str):
+            raise TypeError("Ciphertext must be a string")
+        
+        return (
+            (shift, self.decrypt(ciphertext, shift))
+            for shift in range(self.alphabet_size)
+        )
+    
+    def brute_force_ranked(
+        self, ciphertext: str, top_k: int = 3
+    ) -> List[Tuple[int, str]]:
+        """
+        Perform brute force attack and rank shifts by English-likeness.
+        
+        Each shift is scored with a chi-squared statistic of the decrypted
+        letter counts against English letter frequencies, so only the best
+        candidates need to be decrypted.
+        
+        Args:
+            ciphertext (str): The ciphertext to attack
+            top_k (int): Number of best-scoring results to return; values
+                above 26 return all shifts
+            
+        Raises:
+            TypeError: If ciphertext is not a string or top_k is not an int
+            ValueError: If top_k is negative
+            
+        Returns:
+            List[Tuple[int, str]]: (shift, decrypted_text) tuples, most
+            English-like first
+            
+        Example:
+            >>> cipher = CaesarCipher()
+            >>> cipher.brute_force_ranked("Wklv lv d vhfuhw phvvdjh.", 1)
+            [(3, 'This is a secret message.')]
+        """
         if not isinstance(ciphertext, str):
             raise TypeError("Ciphertext must be a string")
         
-        results = []
+        if not isinstance(top_k, int) or isinstance(top_k, bool):
+            raise TypeError("top_k must be an integer")
         
-        for shift in range(self.alphabet_size):
-            decrypted = self.decrypt(ciphertext, shift)
-            results.append((shift, decrypted))
+        if top_k < 0:
+            raise ValueError("top_k must not be negative")
         
-        return results
+        letter_counts = _get_letter_counts(ciphertext)
+        total_letters = sum(letter_counts)
+        size = self.alphabet_size
+        
+        # Decrypting with a shift maps ciphertext letter i + shift to i
+        scores = []
+        for shift in range(size):
+            score = 0.0
+            for i, frequency in enumerate(ENGLISH_FREQ):
+                expected = frequency * total_letters
+                observed = letter_counts[(i + shift) % size]
+                if expected:
+                    score += (observed - expected) ** 2 / expected
+            scores.append((score, shift))
+        
+        return [
+            (shift, self.decrypt(ciphertext, shift))
+            for _, shift in sorted(scores)[:top_k]
+        ]
     
     def is_valid_shift(self, shift: Union[int, str]) -> bool:
         """
@@ -125,13 +310,20 @@ class CaesarCipher:
             shift (Union[int, str]): The shift value to validate
             
         Returns:
-            bool: True if shift is valid, False otherwise
+            bool: True if shift is an int that is not a bool, or a string of
+            decimal digits with optional surrounding whitespace and one
+            optional sign; False otherwise
         """
-        try:
-            shift_int = int(shift)
+        # Check the type and format directly instead of raising and
+        # catching exceptions from int() on every rejected input
+        if isinstance(shift, int) and not isinstance(shift, bool):
             return True
-        except (ValueError, TypeError):
-            return False
+        if isinstance(shift, str):
+            digits = shift.strip()
+            if digits[:1] in ("+", "-"):
+                digits = digits[1:]
+            return digits.isdecimal()
+        return False
     
     def analyze_frequency(self, text: str) -> dict:
         """
@@ -143,19 +335,15 @@ class CaesarCipher:
         Returns:
             dict: Dictionary with letter frequencies
         """
-        frequency = {}
-        total_letters = 0
-        
-        for char in text.lower():
-            if char in self.lowercase_letters:
-                frequency[char] = frequency.get(char, 0) + 1
-                total_letters += 1
+        letter_counts = _get_letter_counts(text)
+        total_letters = sum(letter_counts)
         
         # Convert to percentages
-        for letter in frequency:
-            frequency[letter] = (frequency[letter] / total_letters) * 100
-        
-        return frequency
+        return {
+            letter: (count / total_letters) * 100
+            for letter, count in zip(self.lowercase_letters, letter_counts)
+            if count
+        }
 
 
 def main():
@@ -187,8 +375,7 @@ def main():
     test_cipher = "Uryyb, Jbeyq!"
     print(f"Attacking: {test_cipher}")
     
-    results = cipher.brute_force(test_cipher)
-    for shift, result in results:
+    for shift, result in cipher.brute_force_iter(test_cipher):
         print(f"Shift {shift:2d}: {result}")
 
 
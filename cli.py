@@ -88,8 +88,7 @@ def brute_force_interactive(cipher):
     print(f"\nBrute force results for: {text}")
     print("-" * 40)
     
-    results = cipher.brute_force(text)
-    for shift, result in results:
+    for shift, result in cipher.brute_force_iter(text):
         print(f"Shift {shift:2d}: {result}")
     
     print("-" * 40)
@@ -197,8 +196,7 @@ Examples:
         print(f"Brute force attack on: {args.brute_force}")
         print("-" * 40)
         
-        results = cipher.brute_force(args.brute_force)
-        for shift, result in results:
+        for shift, result in cipher.brute_force_iter(args.brute_force):
             print(f"Shift {shift:2d}: {result}")
     
     elif args.frequency:
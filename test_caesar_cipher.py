@@ -99,17 +99,68 @@ class TestCaesarCipher(unittest.TestCase):
         shifts = [shift for shift, _ in results]
         self.assertEqual(sorted(shifts), list(range(26)))
     
+    def test_brute_force_iter(self):
+        """Test that lazy brute force yields the same results in order."""
+        ciphertext = "Khoor, Zruog!"
+        results = self.cipher.brute_force_iter(ciphertext)
+        
+        self.assertEqual(next(results), (0, ciphertext))
+        self.assertEqual(next(results), (1, "Jgnnq, Yqtnf!"))
+        self.assertEqual(
+            list(self.cipher.brute_force_iter(ciphertext)),
+            self.cipher.brute_force(ciphertext)
+        )
+        
+        # Type errors are raised on the call, not on first iteration
+        with self.assertRaises(TypeError):
+            self.cipher.brute_force_iter(123)
+    
+    def test_brute_force_ranked(self):
+        """Test that ranked brute force puts the English plaintext first."""
+        plaintext = "The quick brown fox jumps over the lazy dog"
+        ciphertext = self.cipher.encrypt(plaintext, 11)
+        results = self.cipher.brute_force_ranked(ciphertext)
+        
+        # Should return the default top 3 results
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0], (11, plaintext))
+        
+        results = self.cipher.brute_force_ranked(ciphertext, top_k=26)
+        self.assertEqual(sorted(results), self.cipher.brute_force(ciphertext))
+        
+        with self.assertRaises(TypeError):
+            self.cipher.brute_force_ranked(123)
+        
+        with self.assertRaises(TypeError):
+            self.cipher.brute_force_ranked(ciphertext, top_k=2.0)
+        
+        with self.assertRaises(TypeError):
+            self.cipher.brute_force_ranked(ciphertext, top_k=True)
+        
+        with self.assertRaises(ValueError):
+            self.cipher.brute_force_ranked(ciphertext, top_k=-1)
+        
+        self.assertEqual(self.cipher.brute_force_ranked(ciphertext, top_k=0), [])
+    
     def test_is_valid_shift(self):
         """Test shift validation."""
         # Valid shifts
         self.assertTrue(self.cipher.is_valid_shift(5))
         self.assertTrue(self.cipher.is_valid_shift("10"))
         self.assertTrue(self.cipher.is_valid_shift(-3))
+        self.assertTrue(self.cipher.is_valid_shift(" -7 "))
+        self.assertTrue(self.cipher.is_valid_shift("+4"))
         
         # Invalid shifts
         self.assertFalse(self.cipher.is_valid_shift("abc"))
         self.assertFalse(self.cipher.is_valid_shift(None))
         self.assertFalse(self.cipher.is_valid_shift([1, 2, 3]))
+        self.assertFalse(self.cipher.is_valid_shift(""))
+        self.assertFalse(self.cipher.is_valid_shift("-"))
+        self.assertFalse(self.cipher.is_valid_shift("--5"))
+        self.assertFalse(self.cipher.is_valid_shift("1_0"))
+        self.assertFalse(self.cipher.is_valid_shift(True))
+        self.assertFalse(self.cipher.is_valid_shift(3.0))
     
     def test_frequency_analysis(self):
         """Test frequency analysis functionality."""
@@ -136,6 +187,12 @@ class TestCaesarCipher(unittest.TestCase):
         self.assertAlmostEqual(frequencies['c'], expected_freq, places=1)
         self.assertEqual(len(frequencies), 3)
     
+    def test_frequency_analysis_mixed_case(self):
+        """Test that frequency analysis counts both cases as one letter."""
+        frequencies = self.cipher.analyze_frequency("AaaB")
+        
+        self.assertEqual(frequencies, {'a': 75.0, 'b': 25.0})
+    
     def test_empty_string(self):
         """Test handling of empty strings."""
         result = self.cipher.encrypt("", 5)
@@ -202,8 +259,23 @@ class TestEdgeCases(unittest.TestCase):
         result = self.cipher.encrypt(text, 3)
         # Only ASCII letters should be encrypted
         expected = "Kéoor Zöuog! 你好"
-        # Note: This test assumes non-ASCII characters are preserved
-        # The actual behavior depends on implementation
+        self.assertEqual(result, expected)
+        self.assertEqual(self.cipher.decrypt(result, 3), text)
+    
+    def test_long_text(self):
+        """Test encryption of inputs much longer than typical messages."""
+        text = "Hello, World! " * 10000
+        result = self.cipher.encrypt(text, 3)
+        self.assertEqual(result, "Khoor, Zruog! " * 10000)
+        self.assertEqual(self.cipher.decrypt(result, 3), text)
+    
+    def test_repeated_frequency_analysis(self):
+        """Test that repeated queries return independent results."""
+        frequencies = self.cipher.analyze_frequency("aab")
+        frequencies['a'] = 0
+        
+        frequencies = self.cipher.analyze_frequency("aab")
+        self.assertAlmostEqual(frequencies['a'], 200.0 / 3, places=1)
     
     def test_all_non_alphabetic(self):
         """Test with text containing no alphabetic characters."""